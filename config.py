@@ -17,6 +17,8 @@ CANTO_FILE = DATA_DIR / "canto_i_inferno.txt"
 LEXICON_FILE = DATA_DIR / "emotion_lexicons" / "italian_emotions.json"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 MODELS_DIR = PROJECT_ROOT / "models"  # For downloaded models
+ONNX_MODELS_DIR = MODELS_DIR / "onnx"  # Quantized ONNX exports (optional backend)
+NLI_CACHE_FILE = OUTPUT_DIR / "nli_cache.sqlite"  # Cached NLI window scores
 
 # Create directories
 OUTPUT_DIR.mkdir(exist_ok=True)
@@ -17,13 +17,22 @@ Usage:
 import sys
 from pathlib import Path
 import json
+import logging
+import pickle
+import matplotlib
+matplotlib.use('Agg')  # Plots are only saved to file: no GUI backend needed
 import matplotlib.pyplot as plt
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
+
 # Add project root to path
 ROOT = Path(__file__).parent
 sys.path.insert(0, str(ROOT))
 
-from config import CANTO_FILE, OUTPUT_DIR, LEXICON_FILE
+from config import CANTO_FILE, OUTPUT_DIR, LEXICON_FILE, NLI_CACHE_FILE
 from src.preprocessing import TerzinaTokenizer
 from src.emotion import ZeroShotAnalyzer, LexiconEmotionAnalyzer
 
@@ -38,9 +47,11 @@ def main():
 
     # 1. Load Data
     print("\n[1] Loading Text...")
-    tokenizer = TerzinaTokenizer()
-    tercets = tokenizer.tokenize_file(CANTO_FILE)
+    tercets = load_tercets(CANTO_FILE)
     print(f"    Loaded {len(tercets)} tercets.")
+    
+    # Text of each tercet, shared by all the analyses below
+    tercet_texts = [" ".join(v.text for v in t.verses) for t in tercets]
 
     # ---------------------------------------------------------
     # PART A: ZERO-SHOT NLI (Artificial Intelligence)
@@ -49,13 +60,23 @@ def main():
     print("  PART A: ZERO-SHOT NLI (mDeBERTa)")
     print("-" * 40)
     
-    analyzer_nli = ZeroShotAnalyzer()
+    analyzer_nli = ZeroShotAnalyzer(cache_path=NLI_CACHE_FILE)
     success = analyzer_nli.load_model()
     
     if success:
         print("    Running Sliding Window Analysis (Window=2)...")
         window_size = 2
-        results_nli = analyzer_nli.analyze_sliding_window(tercets, window_size=window_size)
+        # Text of each window, joined once from the tercet texts
+        window_texts = [
+            " ".join(tercet_texts[i : i + window_size])
+            for i in range(len(tercet_texts) - window_size + 1)
+        ]
+        results_nli = analyzer_nli.analyze_sliding_window(
+            tercets, window_size=window_size, window_texts=window_texts
+        )
+        
+        # Window x emotion scores, for argmax-based checks below
+        scores_nli = _densify(results_nli, analyzer_nli.EMOTIONS)
         
         # Save Results
         save_results("zeroshot_results.json", results_nli)
@@ -63,7 +84,7 @@ def main():
         
         # Validation
         print("    Validating NLI Results...")
-        validate_results(results_nli)
+        validate_results(results_nli, scores_nli, analyzer_nli.EMOTIONS)
     else:
         print("    SKIPPING NLI (Model failed to load)")
 
@@ -75,28 +96,52 @@ def main():
     print("-" * 40)
     
     analyzer_lex = LexiconEmotionAnalyzer(LEXICON_FILE)
-    results_lex = analyzer_lex.analyze_canto(tercets)
-    print(f"    Analyzed {len(results_lex)} tercets explicitly.")
+    matrix_lex = analyzer_lex.analyze_canto_matrix(tercet_texts)
+    print(f"    Analyzed {len(matrix_lex)} tercets explicitly.")
     
-    # Convert Lexicon results to format compatible with plotter
+    # Keep the lexicon columns matching the plotted emotions
     # Lexicon analysis is per-tercet (Window=1 effectively)
-    lex_format = []
-    for i, score in enumerate(results_lex):
-        lex_format.append({
-            "scores": score.scores
-        })
+    emotion_cols = [analyzer_lex.categories.index(e) for e in analyzer_nli.EMOTIONS]
+    generate_plot(matrix_lex[:, emotion_cols], analyzer_nli.EMOTIONS, 1, "lexicon_curve.png", "Lexicon-Based")
     
-    generate_plot(lex_format, analyzer_nli.EMOTIONS, 1, "lexicon_curve.png", "Lexicon-Based")
 
     # 3. Comparative Showcase (for non-technical audience)
-    perform_comparative_showcase(tercets, results_nli, results_lex)
+    if success:
+        perform_comparative_showcase(
+            tercet_texts, scores_nli, analyzer_nli.EMOTIONS, matrix_lex, analyzer_lex.categories
+        )
 
     print("\n" + "="*70)
     print("  ANALYSIS COMPLETE - output/ folder updated")
     print("="*70)
 
 
-def perform_comparative_showcase(tercets, results_nli, results_lex):
+def load_tercets(canto_file):
+    """
+    Tokenize the canto, reusing the tercets parsed on a previous run.
+    
+    Parsed tercets are pickled to OUTPUT_DIR, keyed by the modification
+    time of the source file: editing the canto invalidates the cache.
+    """
+    cache = OUTPUT_DIR / f"tercets_{canto_file.stat().st_mtime_ns}.pkl"
+    
+    # Drop caches left over from older versions of the file
+    for stale in OUTPUT_DIR.glob("tercets_*.pkl"):
+        if stale != cache:
+            stale.unlink()
+    
+    if cache.exists():
+        try:
+            return pickle.loads(cache.read_bytes())
+        except Exception:
+            pass  # unreadable cache: parse again and overwrite it
+    
+    tercets = TerzinaTokenizer().tokenize_file(canto_file)
+    cache.write_bytes(pickle.dumps(tercets, protocol=5))
+    return tercets
+
+
+def perform_comparative_showcase(tercet_texts, scores_nli, emotions, matrix_lex, lex_categories):
     """
     Highlights the differences between AI (NLI) and Dictionary (Lexicon) 
     on key thematic moments.
@@ -107,8 +152,8 @@ def perform_comparative_showcase(tercets, results_nli, results_lex):
     print("="*70)
 
     # Key moments index mapping
-    # NLI results use sliding window (W=2), so results_nli[i] corresponds to tercet i+1 and i+2
-    # Lexicon results are per-tercet, so results_lex[i] corresponds to tercet i+1
+    # NLI results use sliding window (W=2), so scores_nli[i] corresponds to tercet i+1 and i+2
+    # Lexicon results are per-tercet, so matrix_lex[i] corresponds to tercet i+1
     
     comparisons = [
         {
@@ -130,14 +175,13 @@ def perform_comparative_showcase(tercets, results_nli, results_lex):
 
     for comp in comparisons:
         idx = comp["tercet_idx"]
-        tercet = tercets[idx]
-        text = " / ".join([v.text.strip() for v in tercet.verses])
+        text = tercet_texts[idx]
         
-        nli_score = results_nli[idx]["scores"] # Approx mapping (Wind 0 for Tercet 1)
-        lex_score = results_lex[idx].scores
+        nli_score = scores_nli[idx] # Approx mapping (Wind 0 for Tercet 1)
+        lex_score = matrix_lex[idx]
         
-        nli_top = max(nli_score, key=nli_score.get)
-        lex_top = max(lex_score, key=lex_score.get) if lex_score else "None"
+        nli_top = emotions[nli_score.argmax()]
+        lex_top = lex_categories[lex_score.argmax()] if lex_score.any() else "None"
         
         print(f"\n📍 MOMENT: {comp['name']}")
         print(f"   Text: \"{text[:100]}...\"")
@@ -150,20 +194,55 @@ def perform_comparative_showcase(tercets, results_nli, results_lex):
 
 def save_results(filename, data):
     output_file = OUTPUT_DIR / filename
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        output_file.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
     print(f"    Saved data to {output_file}")
 
 
 import numpy as np
-import seaborn as sns
-from config import CANTO_I_EVENTS
+from numpy.lib.stride_tricks import sliding_window_view
+from matplotlib.collections import LineCollection
+from config import DPI
+
+def _densify(results, emotions):
+    """
+    Turn results into a dense (n_windows, len(emotions)) score matrix.
+    
+    `results` may hold dicts with a 'scores' entry or ZeroShotPrediction
+    objects; emotions missing from a score dict count as 0. A matrix is returned as float32 unchanged.
+    """
+    if isinstance(results, np.ndarray):
+        return results.astype(np.float32, copy=False)
+    
+    matrix = np.zeros((len(results), len(emotions)), np.float32)
+    for i, r in enumerate(results):
+        scores = r['scores'] if isinstance(r, dict) else r.scores_dict
+        for j, emo in enumerate(emotions):
+            value = scores.get(emo)
+            if value is not None:
+                matrix[i, j] = value
+    return matrix
+
 
 def generate_plot(results, emotions, window_size, filename, title_suffix):
     """
     Generate an enhanced plot with smoothing and event annotations.
+    
+    `results` is either a list of result dicts (NLI) or a score
+    matrix of shape (n_windows, len(emotions)) (Lexicon).
     """
-    windows = np.arange(len(results))
+    import seaborn as sns
+    from config import CANTO_I_EVENTS
+    
+    # Emotions x windows
+    data_matrix = _densify(results, emotions).T
+    
+    windows = np.arange(data_matrix.shape[1])
     
     # Prepare figure
     plt.figure(figsize=(14, 8))
@@ -174,18 +253,15 @@ def generate_plot(results, emotions, window_size, filename, title_suffix):
     # Smoothing parameters
     SMOOTHING_WINDOW = 3
     
-    for emo in emotions:
-        # Extract raw data
-        raw_values = [r['scores'].get(emo, 0.0) for r in results]
-        
-        # Apply smoothing (Moving Average)
-        if len(raw_values) > SMOOTHING_WINDOW:
-            kernel = np.ones(SMOOTHING_WINDOW) / SMOOTHING_WINDOW
-            # 'same' keeps the original length
-            smoothed_values = np.convolve(raw_values, kernel, mode='same')
-        else:
-            smoothed_values = raw_values
-            
+    # Apply smoothing (Moving Average) to all emotions at once
+    if data_matrix.shape[1] > SMOOTHING_WINDOW:
+        # Zero padding keeps the original length, like np.convolve(mode='same')
+        padded = np.pad(data_matrix, ((0, 0), (SMOOTHING_WINDOW // 2, (SMOOTHING_WINDOW - 1) // 2)))
+        smoothed = sliding_window_view(padded, SMOOTHING_WINDOW, axis=1).mean(axis=-1)
+    else:
+        smoothed = data_matrix
+    
+    for emo, raw_values, smoothed_values in zip(emotions, data_matrix, smoothed):
         color = EMOTION_COLORS.get(emo, 'black')
         
         # Plot smoothed line
@@ -197,25 +273,36 @@ def generate_plot(results, emotions, window_size, filename, title_suffix):
     # Add Event Annotations
     # Map tercet numbers to window indices
     # We assume results are sequential. results[i] starts at results[i]['start_tercet']
-    tercet_to_index = {r.get('start_tercet', i+1): i for i, r in enumerate(results)}
-    # Fallback for simple list (Lexicon)
-    if not isinstance(results[0], dict) or 'start_tercet' not in results[0]:
-         tercet_to_index = {i+1: i for i in range(len(results))}
+    # Fallback for score matrix (Lexicon)
+    if isinstance(results, np.ndarray) or 'start_tercet' not in results[0]:
+         tercet_to_index = {i+1: i for i in range(len(windows))}
+    else:
+         tercet_to_index = {r['start_tercet']: i for i, r in enumerate(results)}
 
-    # Add vertical lines for key events
+    # Find closest window index of each key event
+    events = [
+        (tercet_num, description, tercet_to_index[tercet_num])
+        for tercet_num, description in CANTO_I_EVENTS.items()
+        if tercet_num in tercet_to_index
+    ]
+    
+    # Add vertical lines for key events, drawn as a single collection
+    # (x in data coordinates, y spanning the whole axes like axvline)
+    ax = plt.gca()
+    event_lines = LineCollection(
+        [[(idx, 0), (idx, 1)] for _, _, idx in events],
+        colors='gray', linestyles=':', alpha=0.5,
+        transform=ax.get_xaxis_transform()
+    )
+    ax.add_collection(event_lines, autolim=False)
+    
     y_max = 1.0 # Probability space
-    offset = 0
-    for tercet_num, description in CANTO_I_EVENTS.items():
-        # Find closest window index
-        idx = tercet_to_index.get(tercet_num)
-        if idx is not None:
-            plt.axvline(x=idx, color='gray', linestyle=':', alpha=0.5)
-            # Add text label (staggered to avoid overlap)
-            y_pos = y_max - 0.05 - (offset * 0.05)
-            plt.text(idx + 0.2, y_pos, f"{tercet_num}: {description}", 
-                     rotation=0, fontsize=8, color='#555', 
-                     bbox=dict(facecolor='white', alpha=0.7, edgecolor='none'))
-            offset = (offset + 1) % 4 # Stagger 4 levels deep
+    for offset, (tercet_num, description, idx) in enumerate(events):
+        # Add text label (staggered 4 levels deep to avoid overlap)
+        y_pos = y_max - 0.05 - ((offset % 4) * 0.05)
+        plt.text(idx + 0.2, y_pos, f"{tercet_num}: {description}", 
+                 rotation=0, fontsize=8, color='#555', 
+                 bbox=dict(facecolor='white', alpha=0.7, edgecolor='none'))
 
     plt.title(f"Evolution of Emotions in Inferno I ({title_suffix})\nSmoothed MA={SMOOTHING_WINDOW} + Event Markers", fontsize=15, weight='bold')
     plt.xlabel(f"Text Window (Rolling {window_size} Tercets)", fontsize=12)
@@ -225,24 +312,21 @@ def generate_plot(results, emotions, window_size, filename, title_suffix):
     plt.tight_layout()
 
     plot_file = OUTPUT_DIR / filename
-    plt.savefig(plot_file, dpi=300)
+    plt.savefig(plot_file, dpi=DPI)
     print(f"    Saved enhanced plot to {plot_file}")
     plt.close()
     
     # Generate Heatmap as companion
-    generate_heatmap(results, emotions, filename.replace("curve", "heatmap"))
+    generate_heatmap(data_matrix, emotions, filename.replace("curve", "heatmap"))
 
 
-def generate_heatmap(results, emotions, filename):
+def generate_heatmap(data_matrix, emotions, filename):
     """
     Generate a 'Semantic Barcode' heatmap.
-    """
-    data_matrix = []
-    for emo in emotions:
-        row = [r['scores'].get(emo, 0.0) for r in results]
-        data_matrix.append(row)
     
-    data_matrix = np.array(data_matrix)
+    `data_matrix` has shape (len(emotions), n_windows).
+    """
+    import seaborn as sns
     
     plt.figure(figsize=(14, 5))
     
@@ -250,34 +334,39 @@ def generate_heatmap(results, emotions, filename):
     # Convert 'config' colors to a list? No, heatmap needs one cmap.
     # "YlGnBu" is clean.
     sns.heatmap(data_matrix, yticklabels=[e.capitalize() for e in emotions], 
-                xticklabels=5, cmap="YlGnBu", cbar_kws={'label': 'Intensity'})
+                xticklabels=5, cmap="YlGnBu", cbar_kws={'label': 'Intensity'},
+                rasterized=True)  # one raster image instead of a vector cell per value
     
     plt.title("Emotion Intensity Heatmap (Semantic Barcode)", fontsize=14)
     plt.xlabel("Window Index")
     plt.tight_layout()
     
     plot_file = OUTPUT_DIR / filename
-    plt.savefig(plot_file, dpi=300)
+    plt.savefig(plot_file, dpi=DPI)
     print(f"    Saved heatmap to {plot_file}")
     plt.close()
 
 
-def validate_results(results):
-    """Check critical points against literary truth."""
+def validate_results(results, scores, emotions):
+    """
+    Check critical points against literary truth.
+    
+    `scores` is the (n_windows, len(emotions)) matrix of `results`.
+    """
     # Hypothesis 1: Start (Window 0) should be Paura or Smarrimento
-    start_emotions = results[0]['scores']
-    top_start = max(start_emotions, key=start_emotions.get)
+    top_start = emotions[scores[0].argmax()]
     print(f"    - INCIPIT (Selva): Dominant emotion is '{top_start.upper()}' (Expected: PAURA/SMARRIMENTO)")
 
     # Hypothesis 2: The Hill (around Tercet 6 -> Window 4-6) should be Speranza
     # Scan region to find peak Speranza
-    hill_region = results[4:7] if len(results) > 7 else results[4:]
-    best_hill_node = max(hill_region, key=lambda x: x['scores'].get('speranza', 0))
+    best_hill = 4 + scores[4:7, emotions.index('speranza')].argmax()
+    best_hill_node = results[best_hill]
     
-    hill_dom = best_hill_node['scores']
-    top_hill = max(hill_dom, key=hill_dom.get)
+    top_hill = emotions[scores[best_hill].argmax()]
     print(f"    - THE HILL (Colle, Window {best_hill_node['start_tercet']}-{best_hill_node['end_tercet']}): Dominant emotion is '{top_hill.upper()}' (Expected: SPERANZA)")
 
 
 if __name__ == "__main__":
+    # Show the analyzers' log messages in the same style as the output above
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     main()
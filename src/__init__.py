@@ -2,16 +2,16 @@
 Source Module - Dante Emotion Analysis
 
 Main package containing all analysis modules.
+
+Subpackages are not imported here, so that importing one of them
+does not load the others (and their heavy dependencies):
+
+    from src.emotion import ZeroShotAnalyzer
+    from src.visualization import save_all_plots
 """
 
 from . import preprocessing
 
-from . import emotion
-from . import visualization
-
 __all__ = [
     "preprocessing",
-    "emotion",
-
-    "visualization",
 ]
@@ -0,0 +1,116 @@
+"""
+NLI Score Cache - Dante Emotion Analysis
+
+Persistent on-disk cache for Zero-Shot NLI scores.
+
+The NLI forward pass is by far the most expensive step of the pipeline,
+and it is deterministic: the same model, text, labels and prompt always give
+the same probabilities. Scores are therefore stored in a small SQLite
+file keyed by a hash of (model, text, labels, hypothesis template,
+multi_label), so re-running the analysis on an unchanged canto needs no
+model inference at all, while changing the prompt never serves stale
+scores.
+"""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class NLIWindowCache:
+    """
+    SQLite-backed cache {key: scores}.
+
+    Usage Example:
+    --------------
+    >>> cache = NLIWindowCache("output/nli_cache.sqlite")
+    >>> key = cache.make_key(f"{model_name}|{backend}", window_text, labels,
+    ...                      hypothesis_template, multi_label)
+    >>> scores = cache.get(key)  # None on a miss
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Open (or create) the cache file.
+
+        Args:
+            path: Path to the SQLite file
+        """
+        self.path = Path(path)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS nli_scores "
+            "(key TEXT PRIMARY KEY, scores TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        model_name: str,
+        text: str,
+        labels: List[str],
+        hypothesis_template: str,
+        multi_label: bool
+    ) -> str:
+        """
+        Hash everything the scores depend on into a cache key.
+
+        Args:
+            model_name: Model name and backend tag
+            text: Premise (window text)
+            labels: Candidate labels, in order
+            hypothesis_template: NLI hypothesis template
+            multi_label: Whether labels were scored independently
+        """
+        payload = "||".join([
+            model_name, text, ",".join(labels), hypothesis_template, str(bool(multi_label))
+        ])
+        return hashlib.blake2b(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, float]]:
+        """Return the cached scores for a key, or None."""
+        row = self._conn.execute(
+            "SELECT scores FROM nli_scores WHERE key = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_many(self, items: Dict[str, Dict[str, float]]):
+        """Store several {key: scores} entries in one transaction."""
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO nli_scores (key, scores) VALUES (?, ?)",
+            [(key, json.dumps(scores)) for key, scores in items.items()]
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM nli_scores").fetchone()[0]
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+# =============================================================================
+# Demo/Test
+# =============================================================================
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = NLIWindowCache(Path(tmp) / "nli_cache.sqlite")
+        labels = ["paura", "speranza"]
+        base = ("model|torch-float32", "Nel mezzo del cammin", labels)
+
+        key = cache.make_key(*base, "Questo testo esprime {}.", False)
+        cache.set_many({key: {"paura": 0.8, "speranza": 0.2}})
+        assert cache.get(key) == {"paura": 0.8, "speranza": 0.2}
+
+        # Any change of prompt must miss the cache
+        assert cache.get(cache.make_key(*base, "Questo verso esprime {}.", False)) is None
+        assert cache.get(cache.make_key(*base, "Questo testo esprime {}.", True)) is None
+        cache.close()
+
+    print("✓ NLI cache keys cover model, text, labels, template and multi_label")
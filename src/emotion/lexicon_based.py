@@ -40,11 +40,29 @@ We created a custom dictionary (italian_emotions.json) that includes:
 """
 
 import json
+import itertools
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+import numpy as np
+
+from ._fast import count_emotions
+
+try:
+    import ahocorasick
+except ImportError:  # optional: falls back to per-word dictionary lookups
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
+
 
 @dataclass
 class EmotionScore:
@@ -71,6 +89,21 @@ class EmotionScore:
         """Convert to numeric vector for plotting."""
         return [self.scores.get(cat, 0.0) for cat in categories]
     
+    @classmethod
+    def from_vector(cls, vector, categories: List[str]) -> "EmotionScore":
+        """
+        Build an EmotionScore from a row of analyze_canto_matrix.
+        
+        Only non-zero emotions are kept, as in analyze_text.
+        Matched words are not available from a score row.
+        """
+        scores = {
+            cat: float(value)
+            for cat, value in zip(categories, vector)
+            if value > 0
+        }
+        return cls(scores=scores)
+    
     def __repr__(self) -> str:
         if self.dominant:
             return f"EmotionScore(dominant={self.dominant}, score={self.scores.get(self.dominant, 0):.2f})"
@@ -96,6 +129,9 @@ class LexiconEmotionAnalyzer:
     to handle Dante's forms.
     """
     
+    # analyze_canto only spreads work over processes above this size
+    PARALLEL_MIN_TERCETS = 64
+    
     def __init__(self, lexicon_path: Optional[str] = None):
         """
         Initialize the analyzer.
@@ -106,10 +142,20 @@ class LexiconEmotionAnalyzer:
         self.lexicon: Dict[str, Dict] = {}
         self.word_to_emotion: Dict[str, List[str]] = {}
         self.categories: List[str] = []
+        self._cat_idx: Dict[str, int] = {}
+        self._vocab: Dict[str, int] = {}
+        self._kw_emotions = np.zeros((0, 0), dtype=np.int8)
+        
+        # Cheap pre-filters: words that cannot be keywords skip the lookup
+        self._first_chars: Set[str] = set()
+        self._len_set: Set[int] = set()
+        
+        # Aho-Corasick automaton over all keywords (built in load_lexicon)
+        self._ac = None
         
         # Normalizer for archaic forms
         from ..preprocessing.normalizer import OldItalianNormalizer
-        self._normalizer = OldItalianNormalizer()
+        self._normalizer = OldItalianNormalizer()  # memoizes each distinct word
         
         # Statistics
         self._total_analyzed = 0
@@ -136,8 +182,11 @@ class LexiconEmotionAnalyzer:
         """
         path = Path(path)
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         # Remove metadata
         if "_metadata" in data:
@@ -149,6 +198,9 @@ class LexiconEmotionAnalyzer:
         # Build reverse index: word → [emotions]
         self._build_word_index()
         
+        # Compile all keywords into a single automaton
+        self._build_automaton()
+        
         total_keywords = sum(
             len(e.get("keywords_modern", [])) + len(e.get("keywords_dante", []))
             for e in self.lexicon.values()
@@ -173,11 +225,97 @@ class LexiconEmotionAnalyzer:
                 if word_lower not in self.word_to_emotion:
                     self.word_to_emotion[word_lower] = []
                 self.word_to_emotion[word_lower].append(emotion)
+        
+        self._first_chars = {word[0] for word in self.word_to_emotion}
+        self._len_set = {len(word) for word in self.word_to_emotion}
+        
+        # Keyword x emotion count matrix for the counting kernel.
+        # A keyword may list the same emotion twice (modern + Dante lists):
+        # it then counts twice.
+        self._cat_idx = {cat: i for i, cat in enumerate(self.categories)}
+        self._vocab = {word: i for i, word in enumerate(self.word_to_emotion)}
+        self._kw_emotions = np.zeros((len(self._vocab), len(self.categories)), dtype=np.int8)
+        for word, emotions in self.word_to_emotion.items():
+            for emotion in emotions:
+                self._kw_emotions[self._vocab[word], self._cat_idx[emotion]] += 1
+    
+    def _build_automaton(self):
+        """
+        Build an Aho-Corasick automaton over the keyword index.
+        
+        The automaton lets analyze_text find every keyword in a single
+        scan of the text. Besides the keywords themselves it indexes the
+        archaic variants that the normalizer maps onto a keyword
+        (e.g. "avea" → "aveva"), so normalization does not require a
+        per-word pass either. Each entry stores (word, keyword, is_variant).
+        
+        Only single-word keywords are indexed: the per-word scan can never
+        match a keyword containing spaces or punctuation ("non so"), and
+        both scans must give the same scores.
+        """
+        self._ac = None
+        if ahocorasick is None or not self.word_to_emotion:
+            return
+        
+        automaton = ahocorasick.Automaton()
+        for word in self.word_to_emotion:
+            if _SINGLE_WORD.fullmatch(word):
+                automaton.add_word(word, (word, word, False))
+        
+        for variant, keyword in self._archaic_variants().items():
+            if _SINGLE_WORD.fullmatch(variant):
+                automaton.add_word(variant, (variant, keyword, True))
+        
+        automaton.make_automaton()
+        self._ac = automaton
+    
+    def _archaic_variants(self) -> Dict[str, str]:
+        """
+        Find Old Italian forms that normalize onto a lexicon keyword.
+        
+        Candidates are generated by inverting the normalizer rules
+        (exact replacements, suffixes, consonant doubling) and are kept
+        only if the normalizer really maps them back to the keyword.
+        
+        Returns:
+            Dictionary {archaic_form: keyword}
+        """
+        normalizer = self._normalizer
+        
+        candidates: Dict[str, Set[str]] = defaultdict(set)
+        for old, modern in normalizer.EXACT_REPLACEMENTS.items():
+            if modern.lower() in self.word_to_emotion:
+                candidates[modern.lower()].add(old.lower())
+        
+        suffix_inverses = [("eva", "ea"), ("iva", "ìa"), ("à", "ade"), ("à", "ate"), ("ù", "ute")]
+        for keyword in self.word_to_emotion:
+            for modern, old in suffix_inverses:
+                if keyword.endswith(modern):
+                    candidates[keyword].add(keyword[:-len(modern)] + old)
+            
+            # Consonant doubling: any subset of "t + vowel" may be doubled
+            parts = re.split(r"(?<=t)(?=[aeiou])", keyword)
+            if len(parts) > 1:
+                for doubled in itertools.product(("", "t"), repeat=len(parts) - 1):
+                    if any(doubled):
+                        candidates[keyword].add(
+                            parts[0] + "".join(d + p for d, p in zip(doubled, parts[1:]))
+                        )
+        
+        variants = {}
+        for keyword, forms in candidates.items():
+            for form in forms:
+                if form in self.word_to_emotion:
+                    continue  # direct matches take priority
+                if normalizer.normalize_word(form) == keyword:
+                    variants[form] = keyword
+        return variants
     
     def analyze_text(
         self, 
         text: str,
-        normalize: bool = True
+        normalize: bool = True,
+        explain: bool = True
     ) -> EmotionScore:
         """
         Analyze a text and return emotional score.
@@ -185,53 +323,110 @@ class LexiconEmotionAnalyzer:
         Args:
             text: Text to analyze (verse, tercet, etc.)
             normalize: Whether to apply ancient→modern normalization
+            explain: Whether to keep the matched words in the result
+                     (disable for bulk analyses that only need scores)
             
         Returns:
             EmotionScore with emotion distribution
         """
         self._total_analyzed += 1
         
-        # Tokenize (simple split for performance)
-        words = text.lower().split()
-        
-        # Clean punctuation
-        import re
-        words = [re.sub(r'[^\w]', '', w) for w in words]
-        words = [w for w in words if w]
+        word_count, hits = self._scan(text, normalize)
         
         # Count matches per emotion
-        emotion_counts: Dict[str, int] = defaultdict(int)
-        matched_words = []
+        counts = count_emotions(
+            np.zeros(len(hits), dtype=np.int32),
+            [self._vocab[keyword] for _, keyword in hits],
+            self._kw_emotions,
+            1
+        )[0]
+        
+        self._total_matches += len(hits)
+        
+        # Normalize scores (proportion over total words)
+        total_words = word_count if word_count else 1
+        scores = {
+            emotion: count / total_words
+            for emotion, count in zip(self.categories, counts.tolist())
+            if count
+        }
+        
+        return EmotionScore(
+            scores=scores,
+            total_matches=len(hits),
+            matched_words=[word for word, _ in hits] if explain else []
+        )
+    
+    def _scan(self, text: str, normalize: bool = True):
+        """
+        Find all keyword matches in a text.
         
+        Returns:
+            (word count, [(matched word, lexicon keyword), ...])
+        """
+        if self._ac is not None:
+            return self._scan_automaton(text, normalize)
+        return self._scan_words(text, normalize)
+    
+    def _scan_automaton(self, text: str, normalize: bool):
+        """
+        Find keyword matches with a single Aho-Corasick scan.
+        
+        Words are delimited exactly as in the per-word scan: punctuation
+        is scrubbed first (so "l'altezza" becomes the single word
+        "laltezza"), and a match counts only if it spans a whole
+        whitespace-separated word. Both scans give the same results.
+        
+        Returns:
+            (word count, [(matched word, lexicon keyword), ...])
+        """
+        text_clean = _TEXT_SCRUB.sub('', text.lower())
+        last = len(text_clean) - 1
+        
+        hits = []
+        
+        for end, (word, keyword, is_variant) in self._ac.iter(text_clean):
+            if is_variant and not normalize:
+                continue
+            start = end - len(word) + 1
+            if start > 0 and not text_clean[start - 1].isspace():
+                continue
+            if end < last and not text_clean[end + 1].isspace():
+                continue
+            hits.append((word, keyword))
+        
+        return len(text_clean.split()), hits
+    
+    def _scan_words(self, text: str, normalize: bool):
+        """
+        Find keyword matches word by word (used without pyahocorasick).
+        
+        Returns:
+            (word count, [(matched word, lexicon keyword), ...])
+        """
+        # Tokenize (simple split for performance) and clean punctuation
+        words = [_WORD_SCRUB.sub('', w) for w in text.lower().split()]
+        words = [w for w in words if w]
+        
+        hits = []
         for word in words:
-            # Try direct match
-            emotions = self._lookup_word(word)
+            # Try direct match (unless no keyword has this first char/length)
+            keyword = word
+            emotions = None
+            if word[0] in self._first_chars and len(word) in self._len_set:
+                emotions = self._lookup_word(word)
             
             # If not found, try normalized form
             if not emotions and normalize:
                 normalized = self._normalizer.normalize_word(word)
                 if normalized != word:
+                    keyword = normalized.lower()
                     emotions = self._lookup_word(normalized)
             
             if emotions:
-                matched_words.append(word)
-                for emotion in emotions:
-                    emotion_counts[emotion] += 1
-        
-        self._total_matches += len(matched_words)
+                hits.append((word, keyword))
         
-        # Normalize scores (proportion over total words)
-        total_words = len(words) if words else 1
-        scores = {
-            emotion: count / total_words
-            for emotion, count in emotion_counts.items()
-        }
-        
-        return EmotionScore(
-            scores=scores,
-            total_matches=len(matched_words),
-            matched_words=matched_words
-        )
+        return len(words), hits
     
     def _lookup_word(self, word: str) -> List[str]:
         """Look up a word in the dictionary."""
@@ -255,26 +450,100 @@ class LexiconEmotionAnalyzer:
     
     def analyze_canto(
         self, 
-        tercets
+        tercets,
+        explain: bool = True,
+        n_jobs: Optional[int] = 1
     ) -> List[EmotionScore]:
         """
         Analyze an entire canto tercet by tercet.
         
+        Tercets are independent, so with n_jobs != 1 inputs longer than
+        PARALLEL_MIN_TERCETS are split across worker processes.
+        If only the scores are needed, analyze_canto_matrix is lighter.
+        
         Args:
-            tercets: List of Tercet objects from tokenizer
+            tercets: List of Tercet objects from tokenizer,
+                     or the already joined text of each tercet
+            explain: Whether to keep the matched words of each tercet
+            n_jobs: Number of worker processes (1 = serial, the default;
+                    None = all CPUs)
             
         Returns:
             List of EmotionScore, one per tercet
         """
-        results = []
+        texts = _tercet_texts(tercets)
+        n_jobs = n_jobs or os.cpu_count() or 1
         
-        for tercet in tercets:
-            verses = [v.text for v in tercet.verses]
-            score = self.analyze_tercet(verses)
-            results.append(score)
+        if n_jobs == 1 or len(texts) <= self.PARALLEL_MIN_TERCETS:
+            return [self.analyze_text(text, explain=explain) for text in texts]
         
+        # One contiguous chunk per worker keeps the tercet order
+        chunk_size = -(-len(texts) // n_jobs)
+        chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [
+                pool.submit(_analyze_texts, self, chunk, explain) for chunk in chunks
+            ]
+            results = [score for future in futures for score in future.result()]
+        
+        # Workers update their own copy of the statistics
+        self._total_analyzed += len(results)
+        self._total_matches += sum(score.total_matches for score in results)
         return results
     
+    def analyze_canto_matrix(self, tercets, window_size: int = 1) -> np.ndarray:
+        """
+        Analyze an entire canto into a dense score matrix.
+        
+        Equivalent to analyze_canto, but skips the per-tercet
+        EmotionScore objects: scores are accumulated directly into
+        a (n_tercets, n_categories) array whose columns follow
+        self.categories. Use EmotionScore.from_vector to inspect a row.
+        
+        With window_size > 1, row i scores the rolling window of tercets
+        i .. i + window_size - 1, like the NLI sliding window. Matches and
+        word counts are additive, so windows are summed from cumulative
+        per-tercet counts instead of scanning the joined text again.
+        
+        Args:
+            tercets: List of Tercet objects from tokenizer,
+                     or the already joined text of each tercet
+            window_size: Number of tercets per row
+            
+        Returns:
+            float32 array of shape (n_windows, len(self.categories)),
+            with n_windows = len(tercets) - window_size + 1
+        """
+        word_counts = np.zeros(len(tercets), dtype=np.int32)
+        row_ids: List[int] = []
+        keyword_ids: List[int] = []
+        
+        for row, text in enumerate(_tercet_texts(tercets)):
+            word_count, hits = self._scan(text)
+            
+            row_ids.extend([row] * len(hits))
+            keyword_ids.extend(self._vocab[keyword] for _, keyword in hits)
+            word_counts[row] = word_count
+            
+            self._total_analyzed += 1
+            self._total_matches += len(hits)
+        
+        # Count all hits of the canto in a single kernel call
+        counts = count_emotions(row_ids, keyword_ids, self._kw_emotions, len(tercets))
+        
+        if window_size > 1:
+            # Window sums as differences of prefix sums: S[i + w] - S[i]
+            n_windows = max(len(tercets) - window_size + 1, 0)
+            count_sums = np.zeros((len(tercets) + 1, counts.shape[1]), dtype=np.int64)
+            np.cumsum(counts, axis=0, out=count_sums[1:])
+            word_sums = np.concatenate(([0], np.cumsum(word_counts, dtype=np.int64)))
+            counts = count_sums[window_size:window_size + n_windows] - count_sums[:n_windows]
+            word_counts = word_sums[window_size:window_size + n_windows] - word_sums[:n_windows]
+        
+        scores = counts / np.maximum(word_counts, 1)[:, None]
+        return scores.astype(np.float32)
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Return analysis statistics."""
         return {
@@ -322,6 +591,32 @@ class LexiconEmotionAnalyzer:
         return "\n".join(lines)
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+# Non-word characters removed from each token by the per-word scan
+_WORD_SCRUB = re.compile(r"[^\w]+")
+
+# The same scrub applied to a whole text (whitespace is kept as delimiter)
+_TEXT_SCRUB = re.compile(r"[^\w\s]+")
+
+# Keywords the per-word scan can match: a single scrubbed word
+_SINGLE_WORD = re.compile(r"\w+")
+
+
+def _analyze_texts(analyzer: LexiconEmotionAnalyzer, texts: List[str], explain: bool):
+    """Analyze a chunk of texts (run in a worker process)."""
+    return [analyzer.analyze_text(text, explain=explain) for text in texts]
+
+
+def _tercet_texts(tercets) -> List[str]:
+    """Join the verses of each tercet (strings are passed through)."""
+    if tercets and isinstance(tercets[0], str):
+        return tercets
+    return [" ".join(v.text for v in tercet.verses) for tercet in tercets]
+
+
 # =============================================================================
 # Convenience Function
 # =============================================================================
@@ -387,3 +682,15 @@ if __name__ == "__main__":
     print("📈 Statistics:")
     for key, value in analyzer.get_statistics().items():
         print(f"  {key}: {value}")
+    
+    # Scan consistency: the Aho-Corasick scan must score exactly like the
+    # per-word fallback, or results would depend on pyahocorasick
+    if analyzer._ac is not None:
+        from ..preprocessing.tokenizer import TerzinaTokenizer
+        tercets = TerzinaTokenizer(normalize=False).tokenize_file(root / "data" / "canto_i_inferno.txt")
+        with_automaton = analyzer.analyze_canto_matrix(tercets)
+        automaton, analyzer._ac = analyzer._ac, None
+        per_word = analyzer.analyze_canto_matrix(tercets)
+        analyzer._ac = automaton
+        assert np.array_equal(with_automaton, per_word), "automaton and per-word scans disagree"
+        print(f"\n✓ Automaton and per-word scans agree on {len(tercets)} tercets")
@@ -24,21 +24,60 @@ The model calculates the probability that the hypothesis is true given the premi
 """
 
 import numpy as np
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
-import warnings
-from config import EMOTION_CATEGORIES
+import logging
+import shutil
+import tempfile
+from contextlib import nullcontext
+from config import EMOTION_CATEGORIES, BATCH_SIZE, ONNX_MODELS_DIR
+from ._cache import NLIWindowCache
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+def _inference_mode():
+    """No autograd bookkeeping during inference (no-op without torch)."""
+    # Imported lazily: only called once a model is loaded, when torch
+    # (if installed) is already in sys.modules
+    try:
+        import torch
+    except ImportError:
+        return nullcontext()
+    return torch.inference_mode()
+
+
+def _logits_to_fp32(module, inputs, outputs):
+    """Forward hook: upcast the logits of a half-precision model to FP32."""
+    outputs.logits = outputs.logits.float()
+    return outputs
+
+
+@dataclass(slots=True)
 class ZeroShotPrediction:
+    """
+    Zero-Shot prediction for one text.
+    
+    `scores` is a float32 array aligned with `labels` (the candidate
+    labels, in the order they were asked), so predictions can be stacked
+    into a matrix; `scores_dict` gives the {label: score} view.
+    """
     text: str
     top_emotion: str
-    scores: Dict[str, float]
+    scores: np.ndarray
     model_name: str
+    labels: Tuple[str, ...] = tuple(EMOTION_CATEGORIES)
+    
+    @property
+    def scores_dict(self) -> Dict[str, float]:
+        return dict(zip(self.labels, self.scores.tolist()))
     
     @property
     def confidence(self) -> float:
-        return self.scores.get(self.top_emotion, 0.0)
+        if self.top_emotion not in self.labels:
+            return 0.0
+        return float(self.scores[self.labels.index(self.top_emotion)])
 
 class ZeroShotAnalyzer:
 
@@ -48,12 +87,31 @@ class ZeroShotAnalyzer:
 
     
     HYPOTHESIS_TEMPLATE = "Questo testo esprime {}." 
+    MULTI_LABEL = False  # We want the best fitting emotion distribution
+    
+    # Files of a complete INT8 ONNX export (see _load_onnx_pipeline)
+    ONNX_REQUIRED_FILES = ("model_quantized.onnx", "config.json", "tokenizer_config.json")
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_path: Optional[str | Path] = None,
+        batch_size: int = BATCH_SIZE
+    ):
+        """
+        Args:
+            cache_path: SQLite file for caching window scores across runs
+                        (None = no cache)
+            batch_size: Number of NLI pairs per forward pass in batch analyses
+        """
         self.pipeline = None
         self.model_name = "MoritzLaurer/mDeBERTa-v3-base-mnli-xnli" # Multilingual (supports Italian), Trained on NLI data (logic/implication), Robust to domain shifts (works better on literature than Twitter models)
         self.device = -1
+        # Inference backend and precision, e.g. "onnx-int8" or "torch-float32"
+        # (set by load_model; part of the cache key, as scores differ slightly)
+        self.backend: Optional[str] = None
         self._simulation_mode = True
+        self.batch_size = batch_size
+        self._cache = NLIWindowCache(cache_path) if cache_path else None
 
     def load_model(self) -> bool:
         """Load the NLI model for Zero-Shot classification."""
@@ -62,22 +120,106 @@ class ZeroShotAnalyzer:
             import torch
             
             self.device = 0 if torch.cuda.is_available() else -1
-            print(f"[INFO] Loading Zero-Shot model: {self.model_name}...")
-            print("       (This is a generic NLI model, not fine-tuned on Twitter)")
+            logger.info(
+                "Loading Zero-Shot model: %s... "
+                "(This is a generic NLI model, not fine-tuned on Twitter)",
+                self.model_name
+            )
+            
+            # On CPU prefer an INT8-quantized ONNX Runtime model, if available
+            if self.device == -1:
+                self.pipeline = self._load_onnx_pipeline()
+                if self.pipeline is not None:
+                    self.backend = "onnx-int8"
+                    self._simulation_mode = False
+                    return True
+            
+            # Half precision on GPU (bfloat16 where supported: same range as FP32).
+            # CPU stays in FP32: most CPUs have no fast half-precision matmuls.
+            if self.device == 0:
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            else:
+                dtype = torch.float32
             
             self.pipeline = pipeline(
                 "zero-shot-classification", 
                 model=self.model_name,
-                device=self.device
+                device=self.device,
+                torch_dtype=dtype
             )
+            if dtype != torch.float32:
+                # Keep the logits, and the softmax over them, in FP32
+                self.pipeline.model.register_forward_hook(_logits_to_fp32)
+            self.backend = f"torch-{str(dtype).removeprefix('torch.')}"
             self._simulation_mode = False
             return True
             
         except Exception as e:
-            print(f"[ERROR] Failed to load model: {e}")
-            print("        Falling back to simulation mode.")
+            logger.error("Failed to load model: %s. Falling back to simulation mode.", e)
             return False
 
+    def _load_onnx_pipeline(self):
+        """
+        Build a zero-shot pipeline on an INT8 ONNX Runtime model.
+        
+        Dynamic INT8 quantization makes the CPU matmuls of mDeBERTa much
+        cheaper at a negligible accuracy cost. The model is exported and
+        quantized on the first run (into a scratch directory renamed into
+        place on success), then loaded from ONNX_MODELS_DIR.
+        Requires `optimum[onnxruntime]`; returns None when it is missing
+        or the export fails, so the caller falls back to PyTorch.
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+            from optimum.pipelines import pipeline as ort_pipeline
+            from transformers import AutoTokenizer
+        except ImportError:
+            return None
+        
+        export_dir = ONNX_MODELS_DIR / self.model_name.replace("/", "__")
+        quantized_dir = export_dir / "int8"
+        
+        try:
+            if not all((quantized_dir / name).exists() for name in self.ONNX_REQUIRED_FILES):
+                logger.info("Exporting model to ONNX and quantizing to INT8 (first run only)...")
+                
+                # Build in a scratch directory and move it into place only
+                # once complete: an interrupted export (or one left by an
+                # older version) is rebuilt instead of loaded forever
+                export_dir.parent.mkdir(parents=True, exist_ok=True)
+                scratch_dir = Path(tempfile.mkdtemp(prefix=export_dir.name + ".", dir=export_dir.parent))
+                try:
+                    model = ORTModelForSequenceClassification.from_pretrained(self.model_name, export=True)
+                    model.save_pretrained(scratch_dir)
+                    quantizer = ORTQuantizer.from_pretrained(scratch_dir)
+                    quantizer.quantize(
+                        save_dir=scratch_dir / "int8",
+                        quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False)
+                    )
+                    AutoTokenizer.from_pretrained(self.model_name).save_pretrained(scratch_dir / "int8")
+                    
+                    shutil.rmtree(export_dir, ignore_errors=True)
+                    scratch_dir.rename(export_dir)
+                finally:
+                    shutil.rmtree(scratch_dir, ignore_errors=True)
+            
+            model = ORTModelForSequenceClassification.from_pretrained(
+                quantized_dir, file_name="model_quantized.onnx"
+            )
+            pipe = ort_pipeline(
+                "zero-shot-classification",
+                model=model,
+                tokenizer=AutoTokenizer.from_pretrained(quantized_dir),
+                accelerator="ort"
+            )
+        except Exception as e:
+            logger.info("ONNX Runtime backend unavailable (%s), using PyTorch.", e)
+            return None
+        
+        logger.info("Using INT8 ONNX Runtime backend.")
+        return pipe
+
     def analyze(self, text: str, emotions: Optional[List[str]] = None) -> ZeroShotPrediction:
         """
         Analyze text using Zero-Shot NLI.
@@ -93,66 +235,201 @@ class ZeroShotAnalyzer:
             
         try:
             # The core NLI call
-            results = self.pipeline(
-                text, 
-                candidate_labels=labels,
-                hypothesis_template=self.HYPOTHESIS_TEMPLATE,
-                multi_label=False # We want the best fitting emotion distribution
-            )
-            
-            # Unpack results
-            scores = dict(zip(results['labels'], results['scores']))
-            top_emotion = results['labels'][0]
+            with _inference_mode():
+                results = self.pipeline(
+                    text, 
+                    candidate_labels=labels,
+                    hypothesis_template=self.HYPOTHESIS_TEMPLATE,
+                    multi_label=self.MULTI_LABEL
+                )
             
-            return ZeroShotPrediction(
-                text=text[:50],
-                top_emotion=top_emotion,
-                scores=scores,
-                model_name=self.model_name
-            )
+            return self._to_prediction(text, results, labels)
             
-        except Exception as e:
-            warnings.warn(f"Analysis failed: {e}")
+        except Exception:
+            logger.exception("Analysis failed, simulating scores")
             return self._simulate(text, labels)
 
-    def analyze_sliding_window(self, tercets, window_size: int = 2) -> List[Dict]:
+    def analyze_batch(
+        self,
+        texts: List[str],
+        emotions: Optional[List[str]] = None,
+        batch_size: Optional[int] = None
+    ) -> List[ZeroShotPrediction]:
+        """
+        Analyze several texts with a single pipeline call.
+        
+        Identical texts are sent to the model once. The unique texts are
+        sorted by length before batching (and restored to input order
+        afterwards), so each padded batch holds inputs of similar length
+        and wastes little compute on pad tokens.
+        
+        Args:
+            texts: The verses/tercets to analyze
+            emotions: List of emotions to test (defaults to self.EMOTIONS)
+            batch_size: NLI pairs per forward pass (defaults to self.batch_size)
+        """
+        labels = emotions or self.EMOTIONS
+        
+        if not texts:
+            return []
+        if self._simulation_mode:
+            return [self._simulate(text, labels) for text in texts]
+        
+        unique_texts = list(dict.fromkeys(texts))
+        order = sorted(range(len(unique_texts)), key=lambda i: len(unique_texts[i]), reverse=True)
+        
+        try:
+            with _inference_mode():
+                results = self.pipeline(
+                    [unique_texts[i] for i in order],
+                    candidate_labels=labels,
+                    hypothesis_template=self.HYPOTHESIS_TEMPLATE,
+                    multi_label=self.MULTI_LABEL,
+                    batch_size=batch_size or self.batch_size
+                )
+        except Exception:
+            logger.exception("Batch analysis failed, simulating scores")
+            return [self._simulate(text, labels) for text in texts]
+        
+        predictions = {}
+        for i, result in zip(order, results):
+            predictions[unique_texts[i]] = self._to_prediction(unique_texts[i], result, labels)
+        return [predictions[text] for text in texts]
+
+    def analyze_many(
+        self,
+        texts: Iterable[str],
+        emotions: Optional[List[str]] = None,
+        batch_size: Optional[int] = None
+    ) -> List[ZeroShotPrediction]:
+        """
+        Analyze any collection of texts (list, pandas Series, ...) in batches.
+        
+        Entry point for distributed runs, where each worker receives a whole
+        column of texts: the batch goes through one pipeline call instead of
+        a Python loop over analyze().
+        
+        Recipe (Spark pandas UDF, one analyzer per worker):
+        
+        >>> @pandas_udf("top string, conf double")
+        ... def nli_udf(texts: pd.Series) -> pd.DataFrame:
+        ...     predictions = analyzer.analyze_many(texts)
+        ...     return pd.DataFrame(
+        ...         [(p.top_emotion, p.confidence) for p in predictions],
+        ...         columns=["top", "conf"]
+        ...     )
+        
+        Args:
+            texts: The verses/tercets to analyze
+            emotions: List of emotions to test (defaults to self.EMOTIONS)
+            batch_size: NLI pairs per forward pass (defaults to self.batch_size)
+        """
+        return self.analyze_batch(list(texts), emotions, batch_size)
+
+    def _to_prediction(self, text: str, result: Dict, labels: List[str]) -> ZeroShotPrediction:
+        """Unpack a pipeline result (labels sorted by score) in `labels` order."""
+        by_label = dict(zip(result['labels'], result['scores']))
+        scores = np.array([by_label[label] for label in labels], dtype=np.float32)
+        top_emotion = result['labels'][0]
+        
+        return ZeroShotPrediction(
+            text=text[:50],
+            top_emotion=top_emotion,
+            scores=scores,
+            model_name=self.model_name,
+            labels=tuple(labels)
+        )
+
+    def analyze_sliding_window(
+        self,
+        tercets,
+        window_size: int = 2,
+        tercet_texts: Optional[List[str]] = None,
+        window_texts: Optional[List[str]] = None
+    ) -> List[Dict]:
         """
         Analyze text using a sliding window of tercets.
         Context is crucial for Dante.
+        
+        Args:
+            tercets: List of Tercet objects from tokenizer
+            window_size: Number of tercets per window
+            tercet_texts: Joined verses of each tercet, if already computed
+            window_texts: Joined text of each window, if already computed
+                          (takes precedence over tercet_texts)
         """
-        results = []
+        windows = [
+            tercets[i : i + window_size]
+            for i in range(0, len(tercets) - window_size + 1)
+        ]
         
-        for i in range(0, len(tercets) - window_size + 1):
-            # Combine 'window_size' tercets
-            window_tercets = tercets[i : i + window_size]
-            
-            # Join text
-            window_text = " ".join([
-                " ".join(v.text for v in t.verses) 
-                for t in window_tercets
-            ])
-            
-            prediction = self.analyze(window_text)
+        if window_texts is None:
+            if tercet_texts is None:
+                tercet_texts = [" ".join(v.text for v in t.verses) for t in tercets]
             
+            # Join text of each window
+            window_texts = [
+                " ".join(tercet_texts[i : i + window_size])
+                for i in range(len(windows))
+            ]
+        
+        results = []
+        for window_tercets, window_text, scores in zip(
+            windows, window_texts, self._window_scores(window_texts)
+        ):
+            top_emotion = max(scores, key=scores.get)
             results.append({
                 "start_tercet": window_tercets[0].number,
                 "end_tercet": window_tercets[-1].number,
                 "text_snippet": window_text,
-                "top_emotion": prediction.top_emotion,
-                "confidence": prediction.confidence,
-                "scores": prediction.scores
+                "top_emotion": top_emotion,
+                "confidence": scores[top_emotion],
+                "scores": scores
             })
             
         return results
 
+    def _window_scores(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Score each window text, reusing cached scores when available.
+        
+        Only real model outputs are cached: simulated scores are random
+        and must never be served on a later run.
+        """
+        if self._cache is None or self._simulation_mode:
+            return [p.scores_dict for p in self.analyze_batch(texts)]
+        
+        # Scores of different backends/precisions are kept apart
+        model_key = f"{self.model_name}|{self.backend}"
+        keys = [
+            NLIWindowCache.make_key(
+                model_key, text, self.EMOTIONS,
+                self.HYPOTHESIS_TEMPLATE, self.MULTI_LABEL
+            )
+            for text in texts
+        ]
+        scores = [self._cache.get(key) for key in keys]
+        
+        # Run the model once over all the misses
+        misses = [i for i, cached in enumerate(scores) if cached is None]
+        predictions = self.analyze_batch([texts[i] for i in misses])
+        
+        new_entries = {}
+        for i, prediction in zip(misses, predictions):
+            scores[i] = prediction.scores_dict
+            if prediction.model_name == self.model_name:
+                new_entries[keys[i]] = scores[i]
+        
+        if new_entries:
+            self._cache.set_many(new_entries)
+        return scores
+
     def _simulate(self, text: str, labels: List[str]) -> ZeroShotPrediction:
         """Fallback for testing without internet/GPU."""
-        import random
-        scores = {label: random.random() for label in labels}
-        
-        # Normalize
-        total = sum(scores.values())
-        scores = {k: v/total for k, v in scores.items()}
+        # Random distribution over the labels
+        probs = np.random.random(len(labels))
+        probs /= probs.sum()
+        scores = dict(zip(labels, probs.tolist()))
         
         # Simple heuristic overrides
         text_lower = text.lower()
@@ -162,4 +439,7 @@ class ZeroShotAnalyzer:
             scores["speranza"] = 0.8
             
         top = max(scores, key=scores.get)
-        return ZeroShotPrediction(text[:50], top, scores, "simulation")
+        return ZeroShotPrediction(
+            text[:50], top, np.array(list(scores.values()), dtype=np.float32),
+            "simulation", tuple(scores)
+        )
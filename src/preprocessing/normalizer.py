@@ -25,12 +25,18 @@ These limitations are INTRINSIC to the approach and must be
 explicitly documented in the analysis results.
 """
 
+import functools
 import re
 from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+# Words, with internal apostrophes (elisions), compiled once at import.
+# The group makes split() keep the words: [gap, word, gap, ..., word, gap]
+_WORD_ONLY = re.compile(r"([\w']+)", re.UNICODE)
+
+
+@dataclass(slots=True)
 class NormalizationResult:
     """
     Normalization result with metadata.
@@ -180,6 +186,10 @@ class OldItalianNormalizer:
         (r"tt([aeiou])", r"t\1", "consonant_tt"),
     ]
     
+    # Cheap pre-filter for REGEX_RULES (keep in sync): a word can only
+    # match a rule if it ends with one of these suffixes or contains "tt"
+    RULE_SUFFIXES: Tuple[str, ...] = ("ea", "ìa", "uto", "ade", "ate", "ute")
+    
     def __init__(self, case_sensitive: bool = False):
         """
         Initialize the normalizer.
@@ -189,13 +199,52 @@ class OldItalianNormalizer:
         """
         self.case_sensitive = case_sensitive
         
-        # Compile regex patterns
-        self._compiled_rules = [
-            (re.compile(pattern, re.IGNORECASE if not case_sensitive else 0), 
-             replacement, 
-             name)
-            for pattern, replacement, name in self.REGEX_RULES
+        # Compiled once per class and case setting, shared by all instances
+        self._combined, self._rules = self._get_compiled_rules(case_sensitive)
+        
+        # Dante's vocabulary is small and Zipfian: the same few words
+        # ("che", "la", "di") are normalized over and over
+        self._normalize_cached = functools.lru_cache(maxsize=20000)(
+            self._normalize_uncached
+        )
+    
+    def __getstate__(self):
+        # The lru_cache wrapper cannot be pickled: rebuilt on unpickling
+        state = self.__dict__.copy()
+        del state["_normalize_cached"]
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._normalize_cached = functools.lru_cache(maxsize=20000)(
+            self._normalize_uncached
+        )
+    
+    @classmethod
+    @functools.lru_cache(maxsize=2)
+    def _get_compiled_rules(
+        cls, case_sensitive: bool
+    ) -> Tuple[re.Pattern, List[Tuple[re.Pattern, str, str]]]:
+        """
+        Compile REGEX_RULES, individually and fused into a single pattern.
+        
+        The fused alternation (a named group per rule) tells in one scan
+        whether a word matches any rule at all; the individual patterns
+        then apply the rule that has priority.
+        
+        Returns:
+            (combined pattern, [(pattern, replacement, rule_name), ...])
+        """
+        flags = re.IGNORECASE if not case_sensitive else 0
+        combined = re.compile(
+            "|".join(f"(?P<{name}>{pattern})" for pattern, _, name in cls.REGEX_RULES),
+            flags
+        )
+        rules = [
+            (re.compile(pattern, flags), replacement, name)
+            for pattern, replacement, name in cls.REGEX_RULES
         ]
+        return combined, rules
     
     def normalize_word(self, word: str) -> str:
         """
@@ -207,7 +256,23 @@ class OldItalianNormalizer:
         Returns:
             Normalized word
         """
-        return self.normalize_with_metadata(word).normalized
+        return self._normalize_cached(word)[0]
+    
+    def normalize_words(self, words: List[str]) -> List[str]:
+        """
+        Normalize a sequence of words (e.g. the tokens of a verse).
+        
+        Same result as calling normalize_word on each word, without
+        the per-word method dispatch.
+        
+        Args:
+            words: Words in Old Italian
+            
+        Returns:
+            Normalized words, in the same order
+        """
+        normalize = self._normalize_cached
+        return [normalize(word)[0] for word in words]
     
     def normalize_with_metadata(self, word: str) -> NormalizationResult:
         """
@@ -219,42 +284,50 @@ class OldItalianNormalizer:
         Returns:
             NormalizationResult with transformation details
         """
-        original = word
+        normalized, rule_applied, confidence = self._normalize_cached(word)
+        return NormalizationResult(
+            original=word,
+            normalized=normalized,
+            rule_applied=rule_applied,
+            confidence=confidence
+        )
+    
+    def _normalize_uncached(self, word: str) -> Tuple[str, Optional[str], float]:
+        """Normalize a word into (normalized, rule_applied, confidence)."""
         lookup_key = word if self.case_sensitive else word.lower()
         
         # 1. Try exact substitution
         if lookup_key in self.EXACT_REPLACEMENTS:
             normalized = self.EXACT_REPLACEMENTS[lookup_key]
-            # Preserve initial capitalization
-            if word[0].isupper() and normalized:
-                normalized = normalized[0].upper() + normalized[1:]
+            # Preserve initial capitalization (computed once per distinct
+            # word, the result is memoized)
+            if normalized and word[:1].isupper():
+                normalized = normalized[:1].upper() + normalized[1:]
             
-            return NormalizationResult(
-                original=original,
-                normalized=normalized,
-                rule_applied="exact_match",
-                confidence=0.95
-            )
-        
-        # 2. Try regex patterns
-        for pattern, replacement, rule_name in self._compiled_rules:
-            if pattern.search(word):
-                normalized = pattern.sub(replacement, word)
-                return NormalizationResult(
-                    original=original,
-                    normalized=normalized,
-                    rule_applied=rule_name,
-                    confidence=0.7  # Less certain than exact match
-                )
+            return normalized, "exact_match", 0.95
+        
+        # 2. Try regex patterns (the first rule in list order wins, and
+        # only that rule is applied), only for the few words that pass
+        # the pre-filter and match at least one rule
+        match = self._may_match_rule(word) and self._combined.search(word)
+        if match:
+            # The combined search finds the leftmost match: an earlier rule
+            # may still match further right, so check those first
+            for pattern, replacement, rule_name in self._rules:
+                if rule_name == match.lastgroup or pattern.search(word):
+                    normalized = pattern.sub(replacement, word)
+                    return normalized, rule_name, 0.7  # Less certain than exact match
         
         # 3. Fallback: return cleaned original word
-        normalized = word.strip()
-        return NormalizationResult(
-            original=original,
-            normalized=normalized,
-            rule_applied=None,
-            confidence=0.5  # Don't know if already modern or not
-        )
+        # (confidence 0.5: don't know if already modern or not)
+        return word.strip(), None, 0.5
+    
+    def _may_match_rule(self, word: str) -> bool:
+        """True unless the word surely matches none of the regex rules."""
+        lower = word.lower()
+        if lower.endswith("\n"):
+            lower = lower[:-1]  # "$" also matches before a final newline
+        return lower.endswith(self.RULE_SUFFIXES) or "tt" in lower
     
     def normalize_text(self, text: str) -> str:
         """
@@ -266,17 +339,17 @@ class OldItalianNormalizer:
         Returns:
             Normalized text
         """
-        # Split preserving spaces and punctuation
-        tokens = re.findall(r"[\w']+|[^\w]", text, re.UNICODE)
+        # Words sit at the odd indices, between spaces and punctuation
+        parts = _WORD_ONLY.split(text)
+        words = parts[1::2]
+        normalized = self.normalize_words(words)
         
-        normalized_tokens = []
-        for token in tokens:
-            if re.match(r"[\w']+", token):
-                normalized_tokens.append(self.normalize_word(token))
-            else:
-                normalized_tokens.append(token)
+        # Nothing to rewrite (e.g. already modern text): skip the join
+        if normalized == words:
+            return text
         
-        return "".join(normalized_tokens)
+        parts[1::2] = normalized
+        return "".join(parts)
     
     def get_normalization_report(self, text: str) -> Dict:
         """
@@ -290,7 +363,7 @@ class OldItalianNormalizer:
         Returns:
             Dictionary with statistics and details
         """
-        words = re.findall(r"[\w']+", text, re.UNICODE)
+        words = _WORD_ONLY.findall(text)
         
         results = []
         rules_count = {}
@@ -17,13 +17,14 @@ For this reason, we implement a custom tokenizer that explicitly
 handles these cases, documenting the choices made.
 """
 
+import functools
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Generator
+from typing import Iterable, List, Optional, Generator
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """
     Representation of a single token.
@@ -47,7 +48,7 @@ class Token:
         return f"Token('{self.text}')"
 
 
-@dataclass 
+@dataclass(slots=True)
 class Verse:
     """
     Representation of a verse.
@@ -69,7 +70,7 @@ class Verse:
         return f"Verse({self.number}: '{self.text[:30]}...')"
 
 
-@dataclass
+@dataclass(slots=True)
 class Tercet:
     """
     Representation of a tercet.
@@ -152,9 +153,8 @@ class TerzinaTokenizer:
         """
         filepath = Path(filepath)
         with open(filepath, 'r', encoding='utf-8') as f:
-            text = f.read()
-        
-        return self.tokenize_canto(text)
+            # Stream the lines: the whole file is never held in memory
+            return self.tokenize_canto_lines(f)
     
     def tokenize_canto(self, text: str) -> List[Tercet]:
         """
@@ -173,6 +173,18 @@ class TerzinaTokenizer:
         Args:
             text: Complete canto text
             
+        Returns:
+            List of tokenized tercets
+        """
+        return self.tokenize_canto_lines(text.strip().split('\n'))
+    
+    def tokenize_canto_lines(self, lines: Iterable[str]) -> List[Tercet]:
+        """
+        Tokenize a canto given line by line (same format as tokenize_canto).
+        
+        Args:
+            lines: Lines of the canto, e.g. an open file
+            
         Returns:
             List of tokenized tercets
         """
@@ -181,8 +193,6 @@ class TerzinaTokenizer:
         current_verses = []
         verse_counter = 0
         
-        lines = text.strip().split('\n')
-        
         for line in lines:
             line = line.strip()
             
@@ -250,24 +260,26 @@ class TerzinaTokenizer:
         """
         raw_tokens = self.TOKEN_PATTERN.findall(text)
         
-        tokens = []
-        for i, raw in enumerate(raw_tokens):
-            # Skip isolated punctuation for now
-            if raw in self.PUNCTUATION:
-                continue
-                
-            normalized = None
-            if self.normalize and self._normalizer:
-                normalized = self._normalizer.normalize_word(raw)
-            
-            token = Token(
+        # Skip isolated punctuation for now
+        kept = [(i, raw) for i, raw in enumerate(raw_tokens) if raw not in self.PUNCTUATION]
+        words = [raw for _, raw in kept]
+        
+        # Normalize the whole verse at once
+        if self.normalize and self._normalizer:
+            normalized = self._normalizer.normalize_words(words)
+        else:
+            normalized = [None] * len(words)
+        
+        tokens = [
+            Token(
                 text=raw,
-                normalized=normalized,
+                normalized=norm,
                 position=i,
                 verse_num=verse_num,
                 tercet_num=tercet_num
             )
-            tokens.append(token)
+            for (i, raw), norm in zip(kept, normalized)
+        ]
         
         return Verse(
             text=text,
@@ -282,6 +294,12 @@ class TerzinaTokenizer:
 # Convenience Functions
 # =============================================================================
 
+@functools.lru_cache(maxsize=2)
+def _get_tokenizer(normalize: bool) -> TerzinaTokenizer:
+    """Shared tokenizer for the convenience functions (built once per setting)."""
+    return TerzinaTokenizer(normalize=normalize)
+
+
 def tokenize_verse(text: str, normalize: bool = True) -> List[Token]:
     """
     Tokenize a single verse (convenience function).
@@ -293,8 +311,7 @@ def tokenize_verse(text: str, normalize: bool = True) -> List[Token]:
     Returns:
         List of Token objects
     """
-    tokenizer = TerzinaTokenizer(normalize=normalize)
-    verse = tokenizer._tokenize_verse(text)
+    verse = _get_tokenizer(normalize)._tokenize_verse(text)
     return verse.tokens
 
 
@@ -308,8 +325,7 @@ def tokenize_canto(filepath: str | Path) -> List[Tercet]:
     Returns:
         List of Tercet objects
     """
-    tokenizer = TerzinaTokenizer()
-    return tokenizer.tokenize_file(filepath)
+    return _get_tokenizer(True).tokenize_file(filepath)
 
 
 # =============================================================================
@@ -17,18 +17,41 @@ Each plot includes annotations highlighting key moments
 of Canto I (beasts, Virgil, etc.).
 """
 
+import os
+
+import matplotlib as mpl
+
+# Headless runs (batch jobs, servers): skip GUI backend machinery entirely
+if os.environ.get("DANTE_HEADLESS"):
+    mpl.use('Agg')
+
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional, Any
-import warnings
 
 # Style configuration
 try:
     plt.style.use('seaborn-v0_8-whitegrid')
-except:
+except Exception:
     plt.style.use('ggplot')
 
+# Label/title fonts shared by all plots
+mpl.rcParams.update({
+    'axes.labelsize': 12,
+    'axes.titlesize': 14,
+    'axes.titleweight': 'bold',
+})
+
+# Snapshot of the resolved style, reapplied around each plot so that
+# rcParams changed later by other libraries don't leak into our figures
+# (the backend is left to the caller)
+_FROZEN_RC = {k: v for k, v in mpl.rcParams.items() if k != 'backend'}
+
 # Colors for emotions
 EMOTION_COLORS = {
     "paura": "#8B0000",      # dark red
@@ -53,15 +76,96 @@ CANTO_I_ANNOTATIONS = {
     46: "Journey begins"
 }
 
+# Above this many points, markers (and heatmap tick labels) are thinned
+# out; the curves themselves are always drawn in full
+MAX_MARKERS = 1000
+
+
+def _results_to_matrix(results: List[Dict] | np.ndarray, emotions: List[str]) -> np.ndarray:
+    """
+    Build the (len(emotions), len(results)) score matrix in one pass.
+    
+    Missing emotions count as 0.0. A precomputed matrix is returned as
+    float32 (no copy if it already is), so plotters accept either form
+    (upstream analyzers already produce one, and large inputs should be
+    passed that way).
+    """
+    if isinstance(results, np.ndarray):
+        return results.astype(np.float32, copy=False)
+    
+    # Plain nested lists, converted by NumPy in a single call: avoids
+    # one ndarray item assignment per cell
+    rows = [[r['scores'].get(emotion, 0.0) for emotion in emotions] for r in results]
+    return np.array(rows, dtype=np.float32).reshape(len(rows), len(emotions)).T
+
+
+def _decimation_step(n_points: int) -> int:
+    """Stride keeping at most MAX_MARKERS of n_points (1 = keep all)."""
+    step = max(1, -(-n_points // MAX_MARKERS))
+    if step > 1:
+        print(f"[INFO] {n_points} points: keeping 1 in {step} markers/labels")
+    return step
+
+
+def _save_figure(
+    fig: plt.Figure,
+    save_path: str,
+    dpi: int,
+    compress_level: Optional[int] = None
+) -> None:
+    """
+    Save a figure, writing PNGs straight through the Agg canvas.
+    
+    print_png skips the savefig dispatch layer, so it is only used where
+    it gives the same file: a plain (headless) Agg canvas, and savefig.*
+    rcParams that savefig would not act on. Other formats (PDF, SVG), GUI
+    canvases (TkAgg, QtAgg, ...: changing their dpi would resize the
+    window) and custom savefig settings go through savefig as usual.
+    `compress_level` (zlib, 0-9; None = Pillow's default) only applies to
+    PNGs: low levels encode much faster for slightly larger files.
+    """
+    is_png = str(save_path).lower().endswith('.png')
+    png_kwargs = {}
+    if is_png and compress_level is not None:
+        png_kwargs['pil_kwargs'] = {'compress_level': compress_level}
+    
+    rc = mpl.rcParams
+    direct = (
+        is_png
+        and type(fig.canvas) is FigureCanvasAgg
+        and rc['savefig.facecolor'] == 'auto'
+        and rc['savefig.edgecolor'] == 'auto'
+        and not rc['savefig.transparent']
+        and rc['savefig.bbox'] is None
+    )
+    if not direct:
+        fig.savefig(save_path, dpi=dpi, **png_kwargs)
+        return
+    
+    screen_dpi = fig.dpi
+    fig.set_dpi(dpi)
+    try:
+        fig.canvas.print_png(save_path, **png_kwargs)
+    finally:
+        fig.set_dpi(screen_dpi)
+
+
+def _plot_ctx():
+    """Context (also usable as a decorator) applying the frozen plot style."""
+    return mpl.rc_context(_FROZEN_RC)
+
 
+@_plot_ctx()
 def plot_emotion_curve(
-    results: List[Dict],
+    results: List[Dict] | np.ndarray,
     emotions: Optional[List[str]] = None,
     title: str = "Emotion Curve - Inferno Canto I",
     figsize: tuple = (14, 6),
     annotate: bool = True,
-    save_path: Optional[str] = None
-) -> plt.Figure:
+    save_path: Optional[str] = None,
+    close: bool = False,
+    compress_level: Optional[int] = None
+) -> Optional[plt.Figure]:
     """
     Generate emotion curve chart.
     
@@ -69,50 +173,92 @@ def plot_emotion_curve(
     with annotations for key moments.
     
     Args:
-        curve: EmotionCurve object
-        emotions: List of emotions to plot (None = all)
+        results: Result dicts with a 'scores' entry, or their precomputed
+                 (len(emotions), n_results) score matrix
+        emotions: List of emotions to plot (None = all; required for a
+                  score matrix, whose rows they label)
         title: Chart title
         figsize: Figure dimensions
         annotate: Whether to add event annotations
         save_path: Path to save (None = only display)
+        close: Close the figure after saving and return None
+        compress_level: PNG zlib level (0-9, lower = faster to encode;
+                        None = Pillow's default)
         
     Returns:
-        Matplotlib Figure object
+        Matplotlib Figure object (None if close=True)
     """
     # Prepare data
-    x = np.arange(len(results))
-    
-    fig, ax = plt.subplots(figsize=figsize)
+    if emotions is None:
+        if isinstance(results, np.ndarray):
+            raise ValueError("emotions is required when results is a score matrix")
+        emotions = list(results[0]['scores']) if len(results) else []
+    data = _results_to_matrix(results, emotions)
+    x = np.arange(data.shape[1])
+    
+    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    
+    # Plot all emotions as one collection of curves, plus one scatter for
+    # the markers (instead of one Line2D artist per emotion)
+    # RGBA array resolved once, shared by the curves, markers and legend
+    colors = np.array([
+        mpl.colors.to_rgba(EMOTION_COLORS.get(emotion, "#666666"))
+        for emotion in emotions
+    ])
+    curves = LineCollection(
+        [np.column_stack([x, y]) for y in data],
+        colors=colors, linewidths=2
+    )
+    ax.add_collection(curves)
+    
+    # Full curves, but markers thinned out on long inputs
+    step = _decimation_step(len(x))
+    x_marks = x[::step]
+    ax.scatter(
+        np.tile(x_marks, len(emotions)), data[:, ::step].ravel(),
+        c=np.repeat(colors, len(x_marks), axis=0), s=16, zorder=3
+    )
+    ax.autoscale_view()
+    ax.set_ylim(0, 1)
     
-    # Plot each emotion
-    for emotion in emotions:
-        y = [r['scores'].get(emotion, 0.0) for r in results]
-        color = EMOTION_COLORS.get(emotion, "#666666")
-        ax.plot(x, y, label=emotion.capitalize(), color=color, linewidth=2, marker='o', markersize=4)
+    # Legend entries (the collection has no per-emotion handles)
+    legend_handles = [
+        Line2D([], [], color=color, linewidth=2, marker='o', markersize=4,
+               label=emotion.capitalize())
+        for emotion, color in zip(emotions, colors)
+    ]
     
     # Key event annotations
     if annotate:
-        for pos, label in CANTO_I_ANNOTATIONS.items():
-            if pos in x:
-                ax.axvline(x=pos, color='gray', linestyle='--', alpha=0.3)
-                ax.annotate(
-                    label,
-                    xy=(pos, ax.get_ylim()[1]),
-                    xytext=(0, 5),
-                    textcoords='offset points',
-                    ha='center',
-                    fontsize=8,
-                    rotation=45,
-                    alpha=0.7
-                )
+        n = len(x)
+        events = [(pos, label) for pos, label in CANTO_I_ANNOTATIONS.items() if 0 <= pos < n]
+        
+        # All event markers in one call, spanning the full axes height
+        ax.vlines(
+            [pos for pos, _ in events], 0, 1,
+            transform=ax.get_xaxis_transform(),
+            colors='gray', linestyles='--', alpha=0.3
+        )
+        
+        # Labels sit on the top edge of the fixed [0, 1] intensity range
+        for pos, label in events:
+            ax.annotate(
+                label,
+                xy=(pos, 1.0),
+                xytext=(0, 5),
+                textcoords='offset points',
+                ha='center',
+                fontsize=8,
+                rotation=45,
+                alpha=0.7
+            )
     
     # Styling
-    ax.set_xlabel("Tercet Number", fontsize=12)
-    ax.set_ylabel("Emotional Intensity", fontsize=12)
-    ax.set_title(title, fontsize=14, fontweight='bold')
-    ax.legend(loc='upper right', framealpha=0.9)
-    ax.set_ylim(0, 1)
+    ax.set(xlabel="Tercet Number", ylabel="Emotional Intensity")
+    # Lift the title above the rotated event labels
+    ax.set_title(title, pad=70 if annotate else None)
     ax.grid(True, alpha=0.3)
+    ax.legend(handles=legend_handles, loc='upper right', framealpha=0.9)
     
     # Methodological note
     fig.text(
@@ -121,19 +267,27 @@ def plot_emotion_curve(
         fontsize=8, style='italic', alpha=0.6
     )
     
-    plt.tight_layout()
-    
     if save_path:
-        fig.savefig(save_path, dpi=150, bbox_inches='tight')
+        _save_figure(fig, save_path, dpi=150, compress_level=compress_level)
         print(f"[INFO] Chart saved: {save_path}")
     
+    if close:
+        plt.close(fig)
+        return None
+    
     return fig
 
 
+@_plot_ctx()
 def plot_emotion_heatmap(
-    results: List[Dict],
+    results: List[Dict] | np.ndarray,
     emotions: List[str],
-) -> plt.Figure:
+    title: str = "Emotion Heatmap - Inferno Canto I",
+    figsize: tuple = (16, 8),
+    save_path: Optional[str] = None,
+    close: bool = False,
+    compress_level: Optional[int] = None
+) -> Optional[plt.Figure]:
     """
     Generate emotion heatmap by tercet.
     
@@ -141,75 +295,95 @@ def plot_emotion_heatmap(
     of all emotions across all tercets simultaneously.
     
     Args:
-        curve: EmotionCurve object
+        results: Result dicts with a 'scores' entry, or their precomputed
+                 (len(emotions), n_results) score matrix
+        emotions: List of emotions (heatmap rows)
         title: Chart title
         figsize: Figure dimensions
         save_path: Path to save
+        close: Close the figure after saving and return None
+        compress_level: PNG zlib level (0-9, lower = faster to encode;
+                        None = Pillow's default)
         
     Returns:
-        Matplotlib Figure object
+        Matplotlib Figure object (None if close=True)
     """
-    try:
-        import seaborn as sns
-    except ImportError:
-        warnings.warn("seaborn not installed. Using base matplotlib.")
-        sns = None
-    
     # Prepare data matrix
-    positions = np.arange(len(results))
-    
-    data = np.zeros((len(emotions), len(positions)))
-    for i, emotion in enumerate(emotions):
-        data[i, :] = [r['scores'].get(emotion, 0.0) for r in results]
-    
-    fig, ax = plt.subplots(figsize=figsize)
-    
-    if sns:
-        sns.heatmap(
-            data,
-            xticklabels=positions,
-            yticklabels=[e.capitalize() for e in emotions],
-            cmap='RdYlBu_r',
-            ax=ax,
-            cbar_kws={'label': 'Intensity'},
-            linewidths=0.5
-        )
-    else:
-        im = ax.imshow(data, aspect='auto', cmap='RdYlBu_r')
-        ax.set_xticks(range(len(positions)))
-        ax.set_xticklabels(positions)
-        ax.set_yticks(range(len(emotions)))
-        ax.set_yticklabels([e.capitalize() for e in emotions])
-        plt.colorbar(im, ax=ax, label='Intensity')
+    data = _results_to_matrix(results, emotions)
+    positions = np.arange(data.shape[1])
     
-    ax.set_xlabel("Tercet Number", fontsize=12)
-    ax.set_ylabel("Emotion", fontsize=12)
-    ax.set_title(title, fontsize=14, fontweight='bold')
+    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    
+    # One image on a uniform grid: far lighter than a per-cell mesh
+    im = ax.imshow(
+        data, aspect='auto', cmap='RdYlBu_r',
+        interpolation='nearest', rasterized=True
+    )
+    ticks = positions[::_decimation_step(len(positions))]
+    ax.set_xticks(ticks)
+    ax.set_xticklabels(ticks)
+    ax.set_yticks(range(len(emotions)))
+    ax.set_yticklabels([e.capitalize() for e in emotions])
+    fig.colorbar(im, ax=ax, label='Intensity')
+    ax.grid(False)
+    
+    ax.set(xlabel="Tercet Number", ylabel="Emotion", title=title)
     
     # Highlight key tercets
     key_tercets = [1, 11, 17, 22]
     for pos in key_tercets:
-        if pos in positions:
-            idx = positions.index(pos)
-            ax.axvline(x=idx, color='white', linewidth=2, alpha=0.7)
-    
-    plt.tight_layout()
+        if 0 <= pos < len(positions):
+            ax.axvline(x=pos, color='white', linewidth=2, alpha=0.7)
     
+    # Only the image is rasterized (at this dpi); axes, ticks and
+    # colorbar text stay vector when saving to PDF/SVG
     if save_path:
-        fig.savefig(save_path, dpi=150, bbox_inches='tight')
+        _save_figure(fig, save_path, dpi=200, compress_level=compress_level)
         print(f"[INFO] Heatmap saved: {save_path}")
     
+    if close:
+        plt.close(fig)
+        return None
+    
     return fig
 
 
 # Embedding space visualization removed (requires missing src/embeddings module)
 
 
+def _init_plot_worker() -> None:
+    """Use the headless Agg backend in save_all_plots worker processes."""
+    mpl.use('Agg')
+
+
+def _render_and_save(
+    kind: str,
+    data: np.ndarray,
+    emotions: List[str],
+    save_path: str,
+    title: Optional[str] = None,
+    compress_level: Optional[int] = None
+) -> str:
+    """
+    Render one plot of save_all_plots and save it (also run in worker processes).
+    
+    Returns:
+        The saved file path
+    """
+    kwargs = {"title": title} if title else {}
+    plotter = plot_emotion_curve if kind == "curve" else plot_emotion_heatmap
+    plotter(data, emotions, save_path=save_path, close=True,
+            compress_level=compress_level, **kwargs)
+    return save_path
+
+
 def save_all_plots(
-    results_nli: List[Dict],
-    results_lex: List[Dict],
+    results_nli: List[Dict] | np.ndarray,
+    results_lex: List[Dict] | np.ndarray,
     emotions: List[str],
-    output_dir: str
+    output_dir: str,
+    compress_level: int = 1,
+    n_jobs: Optional[int] = 1
 ) -> Dict[str, str]:
     """
     Generate and save all plots.
@@ -217,10 +391,16 @@ def save_all_plots(
     Convenience function to create all plots at once.
     
     Args:
-        curve: EmotionCurve object
-        embeddings: DanteEmbeddings object
+        results_nli: Zero-Shot NLI results (dicts or score matrix)
+        results_lex: Lexicon results (dicts or score matrix)
+        emotions: List of emotions to plot
         output_dir: Output directory
-        words_for_embedding: Words for embedding plot
+        compress_level: PNG zlib level; the fast default suits working
+                        outputs, use 9 for final/publication figures
+        n_jobs: Worker processes rendering the plots (1 = serial, in this
+                process; None = all CPUs). Worth it only for large inputs,
+                and on spawn platforms (Windows/macOS) the calling script
+                needs an `if __name__ == "__main__":` guard
         
     Returns:
         Dictionary {plot_name: file_path}
@@ -228,22 +408,32 @@ def save_all_plots(
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    saved = {}
-    
-    # 1. Emotion curve (NLI)
-    path1 = str(output_dir / "zeroshot_curve.png")
-    plot_emotion_curve(results_nli, emotions, title="Zero-Shot NLI Curve", save_path=path1)
-    saved["zeroshot_curve"] = path1
-    
-    # 2. Emotion curve (Lexicon)
-    path2 = str(output_dir / "lexicon_curve.png")
-    plot_emotion_curve(results_lex, emotions, title="Lexicon-Based Curve", save_path=path2)
-    saved["lexicon_curve"] = path2
-    
-    # 3. Heatmap
-    path3 = str(output_dir / "zeroshot_heatmap.png")
-    plot_emotion_heatmap(results_nli, emotions, save_path=path3)
-    saved["zeroshot_heatmap"] = path3
+    # Score matrices, built once and shared by the plots
+    data_nli = _results_to_matrix(results_nli, emotions)
+    data_lex = _results_to_matrix(results_lex, emotions)
+    
+    jobs = {
+        # 1. Emotion curve (NLI)
+        "zeroshot_curve": ("curve", data_nli, "Zero-Shot NLI Curve"),
+        # 2. Emotion curve (Lexicon)
+        "lexicon_curve": ("curve", data_lex, "Lexicon-Based Curve"),
+        # 3. Heatmap
+        "zeroshot_heatmap": ("heatmap", data_nli, None),
+    }
+    
+    args = {
+        name: (kind, data, emotions, str(output_dir / f"{name}.png"), title, compress_level)
+        for name, (kind, data, title) in jobs.items()
+    }
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(jobs))
+    
+    if n_jobs == 1:
+        saved = {name: _render_and_save(*job_args) for name, job_args in args.items()}
+    else:
+        # Independent figures: render and encode them in parallel processes
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_plot_worker) as ex:
+            futures = {name: ex.submit(_render_and_save, *job_args) for name, job_args in args.items()}
+            saved = {name: future.result() for name, future in futures.items()}
     
     print(f"[INFO] All charts saved in: {output_dir}")
     return saved
@@ -258,6 +448,14 @@ if __name__ == "__main__":
     print("VISUALIZATION TEST")
     print("=" * 60)
     
+    # A score matrix carries no emotion names: they must be passed
+    try:
+        plot_emotion_curve(np.zeros((3, 5), dtype=np.float32))
+    except ValueError as e:
+        print(f"✓ Matrix input without emotions rejected: {e}")
+    else:
+        raise AssertionError("matrix input without emotions was accepted")
+    
     # Import necessary modules
     import sys
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))